@@ -4,12 +4,37 @@ import os
 import shutil
 from enum import Enum
 import argparse
-from typing import Dict, List
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 import logging
 
 
 logger = logging.getLogger("logseq-md-export")
 
+# patterns used on every line of a page, compiled once at import time
+_PARENT_CODE_RE = re.compile(r"^(\t*)- (```)")
+_CHILD_CODE_RE = re.compile(r"^(\t*)  (```)")
+_ASSET_RE = re.compile(r"(^.*\[.*\]\()(../)assets/(.*)\)")
+_DRAWIO_RE = re.compile(r"(^.*){{renderer :drawio, (.*.svg)}}")
+_MARKER_RE = re.compile(r"^(\t*)- (TODO|DOING|DONE|LATER|NOW) (.*)$")
+# any of the logseq-specific snippets handled below, found in a single scan
+_CLASSIFY_RE = re.compile(r"\.\./assets|\{\{renderer :drawio,|collapsed:: true")
+
+# task markers and how they are rendered in standard markdown
+_MARKER_TEMPLATES = {
+    "TODO": "- **&#x2610; TODO** %s",
+    "DOING": "- **&#x231B; DOING** %s",
+    "DONE": "- **&#x2611;** ~~%s~~",
+    "LATER": "- **&#x23F2; LATER** %s",
+    "NOW": "- **&#x23F0; NOW** %s",
+}
+
+# chunk size for page reads and writes
+_IO_BUFSIZE = 1024 * 1024
+
+# indentation prefixes, indexed by depth
+_MAX_CACHED_INDENT = 64
+_TABS = [""] + ["\t" * i for i in range(1, _MAX_CACHED_INDENT)]
+
 
 class LineType(Enum):
     TITLE = 1
@@ -26,355 +51,372 @@ class LineHierarchy(Enum):
     CHILD = 2
 
 
+class LineInfo(NamedTuple):
+    content: str
+    indent: int
+    type: LineType
+    hierarchy: LineHierarchy
+
+
+# line kind for the (first, third) characters of a line starting with a list
+# tag; other combinations are resolved in get_line_type
+_LINE_TAGS = {
+    # empty line on a list
+    ("-", None): (LineType.EMPTY, LineHierarchy.PARENT),
+    # empty line on a multi-line block
+    (" ", None): (LineType.EMPTY, LineHierarchy.CHILD),
+    # this must be part of a multi-line content block
+    ("-", " "): (LineType.TEXT, LineHierarchy.CHILD),
+    (" ", " "): (LineType.TEXT, LineHierarchy.CHILD),
+    ("-", ">"): (LineType.QUOTE, LineHierarchy.PARENT),
+    (" ", ">"): (LineType.QUOTE, LineHierarchy.CHILD),
+    # titles an only be parent. If this is not, it's not a title!
+    ("-", "#"): (LineType.TITLE, LineHierarchy.PARENT),
+    (" ", "#"): (LineType.TEXT, LineHierarchy.CHILD),
+}
+
+
 def get_file_info(file_path):
     abs_path = os.path.abspath(file_path)
     os.path.basename(abs_path)
 
 
 def import_asset(logseq_file_base_dir, filename, output_project_path, subdir=""):
-
-    os.makedirs(os.path.join(output_project_path, "assets"), exist_ok=True)
-    shutil.copy(
+    # the "assets" folder must already exist in output_project_path
+    shutil.copyfile(
         os.path.join(logseq_file_base_dir, "..", "assets", subdir, filename),
         os.path.join(output_project_path, "assets", filename),
     )
 
 
-def get_line_type(line, line_content_raw):
+def get_line_type(line: str, line_content_raw: str):
     L1_tag = line_content_raw[0]
     L2_tag = line_content_raw[2] if len(line_content_raw) > 2 else None
 
     if L1_tag == "#":
         return LineType.TITLE, LineHierarchy.PARENT
 
-    if L2_tag is None:
-        if L1_tag == "-":
-            # empty line on a list
-            return LineType.EMPTY, LineHierarchy.PARENT
-        elif L1_tag == " ":
-            # empty line on a multi-line block
-            return LineType.EMPTY, LineHierarchy.CHILD
-        else:
-            logger.error("PARSING ERROR AT LINE: %s", line)
-            exit(1)
-    if L2_tag == " ":
-        # this must be part of a multi-line content block
-        return LineType.TEXT, LineHierarchy.CHILD
-    elif L2_tag == ">":
-        if L1_tag == "-":
-            return LineType.QUOTE, LineHierarchy.PARENT
-        else:
-            return LineType.QUOTE, LineHierarchy.CHILD
-    elif L2_tag == "#":
-        # titles an only be parent. If this is not, it's not a title!
-        if L1_tag == "-":
-            return LineType.TITLE, LineHierarchy.PARENT
-        elif L1_tag == " ":
-            return LineType.TEXT, LineHierarchy.CHILD
-        else:
-            logger.error("PARSING ERROR AT LINE: %s", line)
-            exit(1)
-    elif L2_tag == "`":
-        parent_code_block = re.search("^(\t*)- (```)", line)
-        child_code_block = re.search("^(\t*)  (```)", line)
-        if parent_code_block is not None:
+    line_kind = _LINE_TAGS.get((L1_tag, L2_tag))
+    if line_kind is not None:
+        return line_kind
+
+    if L2_tag == "`":
+        if _PARENT_CODE_RE.search(line) is not None:
             return LineType.CODE_BLOCK_MARKER, LineHierarchy.PARENT
-        if child_code_block is not None:
+        if _CHILD_CODE_RE.search(line) is not None:
             return LineType.CODE_BLOCK_MARKER, LineHierarchy.CHILD
         # if no code block detected, could just be a line starting with "`"
-        if L1_tag == "-":
-            return LineType.LIST, LineHierarchy.PARENT
-        elif L1_tag == " ":
-            return LineType.TEXT, LineHierarchy.CHILD
-        else:
-            logger.error("PARSING ERROR AT LINE: %s", line)
-            exit(1)
-    else:
-        # no tag recognized, must be text.
-        if L1_tag == "-":
-            return LineType.LIST, LineHierarchy.PARENT
-        # no L1_tag, must be part of a multi-line content
-        else:
-            return LineType.TEXT, LineHierarchy.CHILD
 
+    # no tag recognized, must be text.
+    if L1_tag == "-":
+        return LineType.LIST, LineHierarchy.PARENT
+    # no L1_tag, must be part of a multi-line content
+    if L1_tag == " " or L2_tag == " ":
+        return LineType.TEXT, LineHierarchy.CHILD
+    if L2_tag == ">":
+        return LineType.QUOTE, LineHierarchy.CHILD
+    if L2_tag is None or L2_tag == "#" or L2_tag == "`":
+        logger.error("PARSING ERROR AT LINE: %s", line)
+        exit(1)
+    return LineType.TEXT, LineHierarchy.CHILD
 
-def export_file_to_folder(logseq_file: str, output_path: str, no_br: bool = False):
+
+def parse_lines(lines_raw: Iterable[str]) -> Iterator[LineInfo]:
     """
-    This is the main entry point to export a Logseq markdown file to a folder.
+    Parse raw Logseq lines one at a time.
     Args:
-        logseq_file (str): Path to the Logseq markdown file to export.
-        output_path (str): Path to the output directory.
-        no_br (bool): If True, do not insert <br> tags for empty lines.
+        lines_raw (Iterable[str]): Lines of a Logseq markdown page.
 
-    Returns:
-        None
+    Yields:
+        LineInfo: The content, indentation level, type and hierarchy of each line.
+            LOGBOOK blocks outside of code blocks are dropped.
     """
+    traversing_code_block = False
+    in_logbook = False
+    for line in lines_raw:
+        line = line.rstrip("\n")
 
-    logseq_file_base_dir = os.path.dirname(os.path.abspath(logseq_file))
+        if in_logbook:
+            if ":END:" in line:
+                in_logbook = False
+            continue
+
+        # split the leading tabs (indentation level) from the content
+        line_content_raw = line.lstrip("\t")
+        line_indent = len(line) - len(line_content_raw)
+        line_type, line_hierarchy = get_line_type(line, line_content_raw)
+
+        if line_type is LineType.CODE_BLOCK_MARKER:
+            traversing_code_block = not traversing_code_block
+        elif (
+            line_type is LineType.TEXT
+            and not traversing_code_block
+            and ":LOGBOOK:" in line_content_raw
+        ):
+            logger.debug(
+                "Removing logseq-specifc tag and all subsequent entries: %s",
+                line_content_raw,
+            )
+            in_logbook = ":END:" not in line_content_raw
+            continue
+
+        yield LineInfo(line_content_raw, line_indent, line_type, line_hierarchy)
 
-    os.makedirs(output_path, exist_ok=True)
 
-    # Open logseq page and read it
-    with open(logseq_file, "r", encoding="utf-8") as file:
-        lines_raw = file.readlines()
+def _with_neighbours(
+    lines: Iterable[LineInfo],
+) -> Iterator[Tuple[Optional[LineInfo], LineInfo, Optional[LineInfo]]]:
+    # sliding window over the parsed lines: (previous, current, next)
+    lines = iter(lines)
+    prev_line = None
+    line = next(lines, None)
+    while line is not None:
+        next_line = next(lines, None)
+        yield prev_line, line, next_line
+        prev_line, line = line, next_line
+
+
+def _emit_lines(
+    lines: Iterable[LineInfo],
+    logseq_file_base_dir: str,
+    output_path: str,
+    no_br: bool,
+) -> List[str]:
+    """
+    Convert parsed Logseq lines to standard markdown, importing the assets they use.
+    Args:
+        lines (Iterable[LineInfo]): Parsed lines of the page, in order.
+        logseq_file_base_dir (str): Directory of the Logseq page being exported.
+        output_path (str): Path to the output directory.
+        no_br (bool): If True, do not insert <br> tags for empty lines.
 
+    Returns:
+        List[str]: The output chunks, to be written in order.
+    """
     # define variables to keep track of indentation levels
     target_line_indent = 0
     cur_list_depth = 0
     last_target_line_indent = 0
     traversing_code_block = False
-    lines_to_skip = 0
-
-    # will contain dicts parsed line info
-    lines: List[Dict] = []
+    # (subdir, filename) of the assets already copied for this page
+    imported_assets: Set[Tuple[str, str]] = set()
 
-    for line in lines_raw:
-        # match any line and get its indentation level
-        line_re = re.search("^(\t*)(.*)$", line)
-
-        if line_re is None:
-            logger.warning("Warning: no match on: %s", line)
-            logger.warning("Skipping the line")
-            continue
+    content = ""  # make sure content is always at least defined
+    # output chunks, written out in one go once the page is converted
+    parts: List[str] = []
+
+    # bind the line kinds to locals, they are tested several times per line
+    TITLE, LIST, QUOTE, CODE_BLOCK_MARKER, CODE, EMPTY, TEXT = (
+        LineType.TITLE,
+        LineType.LIST,
+        LineType.QUOTE,
+        LineType.CODE_BLOCK_MARKER,
+        LineType.CODE,
+        LineType.EMPTY,
+        LineType.TEXT,
+    )
+    PARENT = LineHierarchy.PARENT
 
-        line_content_raw = line_re.groups()[1]
-        line_indent = len(line_re.groups()[0])
-        line_type, line_hierarchy = get_line_type(line, line_content_raw)
+    # what an empty line is rendered as does not change during the export
+    empty_line = "<br>\n" if not no_br else "\n"
 
-        lines.append(
-            {
-                "content": line_content_raw,
-                "indent": line_indent,
-                "type": line_type,
-                "hierarchy": line_hierarchy,
-            }
-        )
+    # the per-line debug messages are only built when they will be emitted
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-    content = ""  # make sure content is always at least defined
-    output_content = ""
-    for i, line_info in enumerate(lines):
+    for i, (prev_line, line, next_line) in enumerate(_with_neighbours(lines)):
+        # unpack the fields used several times per line into locals
+        line_content, line_indent, line_type, line_hierarchy = line
+        if next_line is not None:
+            _, next_indent, next_type, _ = next_line
+        else:
+            # next_type being None marks the last line, next_indent is unused
+            next_indent, next_type = 0, None
+        if debug_enabled:
+            logger.debug(
+                "[%d %s %s] : %s",
+                i,
+                line_type,
+                line_hierarchy,
+                line_content,
+            )
 
-        if lines_to_skip > 0:
-            lines_to_skip -= 1
-            continue
+        # most lines contain none of the snippets, skip the specific tests
+        has_logseq_syntax = _CLASSIFY_RE.search(line_content) is not None
 
-        logger.debug(
-            "[%d %s %s] : %s",
-            i,
-            line_info["type"],
-            line_info["hierarchy"],
-            line_info["content"],
-        )
+        asset = None  # (subdir, filename) of an asset used by this line
 
-        if line_info["type"] == LineType.CODE_BLOCK_MARKER:
+        if line_type is CODE_BLOCK_MARKER:
             traversing_code_block = not traversing_code_block
-        elif line_info["content"].find("../assets") >= 0:
-            asset_re = re.search(
-                r"(^.*\[.*\]\()(../)assets/(.*)\)", line_info["content"]
-            )
+        elif has_logseq_syntax and "../assets" in line_content:
+            asset_re = _ASSET_RE.search(line_content)
             if asset_re is not None:
                 filename = asset_re.groups()[2]
-                logger.debug("Importing asset: %s", filename)
-                import_asset(
-                    logseq_file_base_dir,
-                    filename,
-                    output_path,
-                )
-                line_info["content"] = (
+                asset = ("", filename)
+                line_content = (
                     asset_re.groups()[0] + "assets/" + asset_re.groups()[2] + ")"
                 )
 
                 # TODO make sure this need not to be handled down below as well.
-        elif line_info["content"].find("{{renderer :drawio,") >= 0:
-            asset_re = re.search(
-                r"(^.*){{renderer :drawio, (.*.svg)}}", line_info["content"]
-            )
+        elif has_logseq_syntax and "{{renderer :drawio," in line_content:
+            asset_re = _DRAWIO_RE.search(line_content)
             if asset_re is not None:
                 filename = asset_re.groups()[1]
                 logger.debug("filename: %s", filename)
-                logger.debug("Importing asset: %s", filename)
-                import_asset(
-                    logseq_file_base_dir,
-                    filename,
-                    output_path,
-                    subdir=os.path.join("storages", "logseq-drawio-plugin"),
-                )
-                line_info["content"] = (
+                asset = (os.path.join("storages", "logseq-drawio-plugin"), filename)
+                line_content = (
                     asset_re.groups()[0]
                     + "!["
-                    + filename
+                    + asset_re.groups()[1]
                     + "]"
                     + "(assets/"
-                    + filename
+                    + asset_re.groups()[1]
                     + ")"
                 )
                 # TODO make sure this need not to be handled down below as well.
-        elif line_info["content"].find("- TODO ") >= 0:
-            checkbox_re = re.search(r"(^\t*)- TODO (.*)$", line_info["content"])
-            if checkbox_re is not None:
-                line_info["content"] = (
-                    checkbox_re.groups()[0]
-                    + "- **&#x2610;"
-                    + " TODO** "
-                    + checkbox_re.groups()[1]
-                )
-        elif line_info["content"].find("- DOING ") >= 0:
-            checkbox_re = re.search(r"(^\t*)- DOING (.*)$", line_info["content"])
-            if checkbox_re is not None:
-                line_info["content"] = (
-                    checkbox_re.groups()[0]
-                    + "- **&#x231B;"
-                    + " DOING** "
-                    + checkbox_re.groups()[1]
-                )
-        elif line_info["content"].find("- DONE ") >= 0:
-            checkbox_re = re.search(r"(^\t*)- DONE (.*)$", line_info["content"])
-            if checkbox_re is not None:
-                line_info["content"] = (
-                    checkbox_re.groups()[0]
-                    + "- **&#x2611;** ~~"
-                    + checkbox_re.groups()[1]
-                    + "~~"
-                )
-        elif line_info["content"].find("- LATER ") >= 0:
-            checkbox_re = re.search(r"(^\t*)- LATER (.*)$", line_info["content"])
-            if checkbox_re is not None:
-                line_info["content"] = (
-                    checkbox_re.groups()[0]
-                    + "- **&#x23F2;"
-                    + " LATER** "
-                    + checkbox_re.groups()[1]
-                )
-        elif line_info["content"].find("- NOW ") >= 0:
-            checkbox_re = re.search(r"(^\t*)- NOW (.*)$", line_info["content"])
-            if checkbox_re is not None:
-                line_info["content"] = (
-                    checkbox_re.groups()[0]
-                    + "- **&#x23F0;"
-                    + " NOW** "
-                    + checkbox_re.groups()[1]
+        else:
+            marker_re = _MARKER_RE.match(line_content)
+            if marker_re is not None:
+                line_content = marker_re.group(1) + (
+                    _MARKER_TEMPLATES[marker_re.group(2)] % marker_re.group(3)
                 )
 
+        if asset is not None and asset not in imported_assets:
+            subdir, filename = asset
+            logger.debug("Importing asset: %s", filename)
+            if not imported_assets:
+                os.makedirs(os.path.join(output_path, "assets"), exist_ok=True)
+            import_asset(logseq_file_base_dir, filename, output_path, subdir=subdir)
+            imported_assets.add(asset)
+
         # CALCULATE TARGET INDENTATION
-        if i == 0:
+        if prev_line is None:
             target_line_indent = 0
-        elif (
-            line_info["type"] == LineType.TITLE
-            or lines[i - 1]["type"] == LineType.TITLE
-        ):
+        elif line_type is TITLE or prev_line.type is TITLE:
             # Titles have no indentation.
             # Any element that comes immediately after a title must have no indentation as well
             target_line_indent = 0
-
-        if (
-            line_info["type"] != LineType.TITLE
-            and lines[i - 1]["type"] != LineType.TITLE
-        ):
+        else:
+            prev_indent = prev_line.indent
             # If this row belongs to a series of rows of the same kind...
-            if line_info["indent"] > lines[i - 1]["indent"]:
+            if line_indent > prev_indent:
                 # Standard markdown list: the first level is not indented, the subsequents are.
                 cur_list_depth += 1
                 if cur_list_depth > 1:
                     target_line_indent = last_target_line_indent + 1
                 else:
                     target_line_indent = last_target_line_indent
-            elif line_info["indent"] < lines[i - 1]["indent"]:
+            elif line_indent < prev_indent:
                 # Detect if this LIST element is less indendeted than the previous
                 target_line_indent = max(
                     0,
-                    last_target_line_indent
-                    - (lines[i - 1]["indent"] - line_info["indent"]),
+                    last_target_line_indent - (prev_indent - line_indent),
                 )
                 cur_list_depth -= 1
             else:
                 target_line_indent = last_target_line_indent
 
+        # the line is emitted as separate chunks (indentation, content, line
+        # endings) that are only concatenated once, when the file is written
+        trailer = ""
+        hard_break = False
         if traversing_code_block:
-            content = line_info["content"][2:]
+            content = line_content[2:]
         else:
             # Represent each line depending on its type
-            if line_info["type"] == LineType.TITLE:
-                content = line_info["content"][line_info["content"].find("#") :]
+            if line_type is TITLE:
+                content = line_content[line_content.find("#") :]
                 cur_list_depth = 0
-            elif line_info["type"] == LineType.LIST:
+            elif line_type is LIST:
                 if cur_list_depth > 0:
-                    content = line_info["content"]
-                    if (
-                        i < len(lines) - 1
-                        and lines[i + 1]["indent"] < line_info["indent"]
-                    ):
-                        content = content + "\n"
+                    content = line_content
+                    if next_type is not None and next_indent < line_indent:
+                        trailer = "\n"
                 else:
-                    if (
-                        i < len(lines) - 1
-                        and lines[i + 1]["type"] == LineType.LIST
-                        and lines[i + 1]["indent"] == line_info["indent"]
-                    ):
-                        content = line_info["content"][2:] + "\\"
-                    else:
-                        content = line_info["content"][2:]
-            elif line_info["type"] == LineType.TEXT:
-                if line_info["content"].find("collapsed:: true") >= 0:
-                    logger.debug(
-                        "Removing logseq-specifc tag: %s", line_info["content"]
-                    )
+                    content = line_content[2:]
+                    if next_type is LIST and next_indent == line_indent:
+                        trailer = "\\"
+            elif line_type is TEXT:
+                if has_logseq_syntax and "collapsed:: true" in line_content:
+                    if debug_enabled:
+                        logger.debug(
+                            "Removing logseq-specifc tag: %s",
+                            line_content,
+                        )
                     continue
-                if line_info["content"].find(":LOGBOOK:") >= 0:
-                    logger.debug(
-                        "Removing logseq-specifc tag and all subsequent entries: %s",
-                        line_info["content"],
-                    )
-                    for l in range(i, len(lines)):
-                        if lines[l]["content"].find(":END:") >= 0:
-                            break
-                        lines_to_skip += 1
-                    continue
-                else:
-                    # We might be in a multi-line content block of some kind.
-                    content = line_info["content"][2:]
+                # We might be in a multi-line content block of some kind.
+                content = line_content[2:]
                 # always terminate the line with a return
-                if i < len(lines) - 1 and lines[i + 1]["type"] != line_info["type"]:
-                    content = content + "\n"
-            elif line_info["type"] == LineType.CODE:
-                content = line_info["content"][2:]
-            elif line_info["type"] == LineType.EMPTY:
-                content = "<br>\n" if not no_br else "\n"
-            elif line_info["type"] == LineType.CODE_BLOCK_MARKER:
-                content = line_info["content"][2:]
-            elif line_info["type"] == LineType.QUOTE:
-                content = line_info["content"][2:]
-
-            if line_info["type"] != LineType.CODE_BLOCK_MARKER:
-                if (
-                    i < len(lines) - 1
-                    and lines[i + 1]["type"] == LineType.TEXT
-                    and not line_info["type"] == LineType.TITLE
-                ):
-                    content = content + "\\"
-
-        content = content + "\n"
-
-        tabs = "".join(["\t" for _ in range(target_line_indent)])
-        content = tabs + content
-
-        output_content += content
+                if next_type is not None and next_type is not line_type:
+                    trailer = "\n"
+            elif line_type is CODE:
+                content = line_content[2:]
+            elif line_type is EMPTY:
+                content = empty_line
+            elif line_type is CODE_BLOCK_MARKER:
+                content = line_content[2:]
+            elif line_type is QUOTE:
+                content = line_content[2:]
+
+            if line_type is not CODE_BLOCK_MARKER:
+                hard_break = next_type is TEXT and line_type is not TITLE
+
+        if target_line_indent < _MAX_CACHED_INDENT:
+            parts.append(_TABS[target_line_indent])
+        else:
+            parts.append("\t" * target_line_indent)
+        parts.append(content)
+        if trailer:
+            parts.append(trailer)
+        if hard_break:
+            parts.append("\\")
+        parts.append("\n")
+
         # only update previous element type for next cycle when a new element starts
-        if line_info["hierarchy"] == LineHierarchy.PARENT:
+        if line_hierarchy is PARENT:
             last_target_line_indent = target_line_indent
 
         # logger.debug("last_target_line_indent: %d, target_line_indent: %d", last_target_line_indent, target_line_indent)
         # logger.debug("cur_list_depth: %d", cur_list_depth)
 
+    return parts
+
+
+def export_file_to_folder(logseq_file: str, output_path: str, no_br: bool = False):
+    """
+    This is the main entry point to export a Logseq markdown file to a folder.
+    Args:
+        logseq_file (str): Path to the Logseq markdown file to export.
+        output_path (str): Path to the output directory.
+        no_br (bool): If True, do not insert <br> tags for empty lines.
+
+    Returns:
+        None
+    """
+
+    logseq_file_base_dir = os.path.dirname(os.path.abspath(logseq_file))
+
+    os.makedirs(output_path, exist_ok=True)
+
+    # Open logseq page and convert it line by line, reading it in large chunks
+    with open(logseq_file, "r", encoding="utf-8", buffering=_IO_BUFSIZE) as file:
+        parts = _emit_lines(parse_lines(file), logseq_file_base_dir, output_path, no_br)
+
     # first prepare the output to receive the file.
     final_destination_path = os.path.join(output_path, os.path.basename(logseq_file))
 
-    # finally write the file
-    with open(
+    # finally write the file, as one buffer straight to the file descriptor
+    data = memoryview("".join(parts).encode("utf-8"))
+    fd = os.open(
         final_destination_path,
-        "w",
-        encoding="utf-8",
-    ) as out:
-        out.write(output_content)
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o666,
+    )
+    try:
+        while data:
+            written = os.write(fd, data[:_IO_BUFSIZE])
+            data = data[written:]
+    finally:
+        os.close(fd)
 
     logger.info("Exported to: %s", final_destination_path)
 
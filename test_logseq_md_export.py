@@ -0,0 +1,28 @@
+import pytest
+
+from logseq_md_export import export_file_to_folder
+
+
+def export(tmp_path, page_content: bytes) -> bytes:
+    page = tmp_path / "pages" / "page.md"
+    page.parent.mkdir()
+    page.write_bytes(page_content)
+    export_file_to_folder(str(page), str(tmp_path / "out"))
+    return (tmp_path / "out" / "page.md").read_bytes()
+
+
+def test_non_ascii_line_start(tmp_path):
+    # line tags and prefix removal work on characters, not on UTF-8 bytes
+    page = "标签:: 书\n- café\n\té#x\n".encode("utf-8")
+    assert export(tmp_path, page).decode("utf-8") == ":: 书\n\ncafé\\\nx\n"
+
+
+def test_non_ascii_short_line_is_a_parsing_error(tmp_path):
+    with pytest.raises(SystemExit):
+        export(tmp_path, "- a\n中文\n".encode("utf-8"))
+
+
+def test_byte_order_mark(tmp_path):
+    # the BOM counts as one character of the first line
+    page = "\ufeff- first\n- second\n".encode("utf-8")
+    assert export(tmp_path, page).decode("utf-8") == " first\n\nsecond\n"